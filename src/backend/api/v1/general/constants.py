@@ -1,2 +1,9 @@
 MAX_PAGE_SIZE = 100
 PAGE_SIZE_QUERY_PARAM = "page_size"
+
+# Точное количество объектов кэшируется по тексту запроса на короткое
+# время, поэтому после изменений оно может отставать на это время.
+COUNT_CACHE_KEY = "pagination:count:{}"
+COUNT_CACHE_TIMEOUT = 30
+CURSOR_QUERY_PARAM = "cursor"
+INVALID_CURSOR_MESSAGE = "Неверный курсор."
@@ -1,8 +1,254 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as BinasciiError
+from functools import cached_property, reduce
+from hashlib import md5
+from operator import or_
+from typing import Optional
+
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet, ValidationError
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Q, QuerySet
+from rest_framework.exceptions import NotFound
 from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+from .constants import (
+    COUNT_CACHE_KEY,
+    COUNT_CACHE_TIMEOUT,
+    CURSOR_QUERY_PARAM,
+    INVALID_CURSOR_MESSAGE,
+    MAX_PAGE_SIZE,
+    PAGE_SIZE_QUERY_PARAM,
+)
+
+
+def get_count_estimate(queryset: QuerySet) -> Optional[int]:
+    """
+    Функция получения оценки количества объектов queryset-а планировщиком
+    PostgreSQL. Для других баз данных оценка не поддерживается.
+    """
+
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return None
+    sql, params = queryset.order_by().query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        explain = cursor.fetchone()[0]
+    if isinstance(explain, str):
+        explain = json.loads(explain)
+    return int(explain[0]["Plan"]["Plan Rows"])
+
+
+class CountStrategyPaginator(Paginator):
+    """
+    Пагинатор с выбором способа подсчета объектов.
+
+    Если оценка планировщика больше count_estimate_threshold, то вместо
+    COUNT(*) возвращается она, а is_count_approximate становится True.
+    Иначе точное количество кэшируется по тексту запроса на
+    count_cache_timeout секунд.
+    """
 
-from .constants import MAX_PAGE_SIZE, PAGE_SIZE_QUERY_PARAM
+    def __init__(
+        self,
+        object_list,
+        per_page,
+        count_cache_timeout: Optional[int] = None,
+        count_estimate_threshold: Optional[int] = None,
+        **kwargs,
+    ):
+        super().__init__(object_list, per_page, **kwargs)
+        self.count_cache_timeout = count_cache_timeout
+        self.count_estimate_threshold = count_estimate_threshold
+        self.is_count_approximate = False
+
+    @cached_property
+    def count(self) -> int:
+        queryset = self.object_list
+        if not isinstance(queryset, QuerySet):
+            return super().count
+        try:
+            if self.count_estimate_threshold is not None:
+                estimate = get_count_estimate(queryset)
+                if (
+                    estimate is not None
+                    and estimate > self.count_estimate_threshold
+                ):
+                    self.is_count_approximate = True
+                    return estimate
+            if not self.count_cache_timeout:
+                return super().count
+            sql, params = queryset.order_by().query.sql_with_params()
+        except EmptyResultSet:
+            return 0
+        cache_key = COUNT_CACHE_KEY.format(
+            md5(f"{queryset.db}:{sql}:{params!r}".encode()).hexdigest()
+        )
+        count = cache.get(cache_key)
+        if count is None:
+            count = super().count
+            cache.set(cache_key, count, self.count_cache_timeout)
+        return count
 
 
 class BasePagination(PageNumberPagination):
+    """
+    Постраничная пагинация с настраиваемым подсчетом общего количества.
+
+    count_cache_timeout - время кэширования точного количества, None
+    отключает кэш. count_estimate_threshold - порог, выше которого
+    используется оценка планировщика PostgreSQL, None отключает оценку.
+    """
+
     page_size_query_param = PAGE_SIZE_QUERY_PARAM
     max_page_size = MAX_PAGE_SIZE
+    count_cache_timeout: Optional[int] = COUNT_CACHE_TIMEOUT
+    count_estimate_threshold: Optional[int] = None
+
+    def django_paginator_class(self, object_list, per_page):
+        return CountStrategyPaginator(
+            object_list,
+            per_page,
+            count_cache_timeout=self.count_cache_timeout,
+            count_estimate_threshold=self.count_estimate_threshold,
+        )
+
+    def get_paginated_response(self, data):
+        paginator = self.page.paginator
+        return Response(
+            {
+                "count": paginator.count,
+                "count_is_approximate": paginator.is_count_approximate,
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema["properties"]["count_is_approximate"] = {
+            "type": "boolean",
+            "example": False,
+        }
+        return response_schema
+
+
+class KeysetPagination(BasePagination):
+    """
+    Постраничная пагинация с дополнительным режимом по ключу (keyset).
+
+    Режим включается параметром cursor: пустое значение запрашивает первую
+    страницу, а в ответе возвращается ссылка на следующую. Вместо OFFSET и
+    COUNT(*) страница выбирается условием на значения полей сортировки
+    последнего объекта предыдущей страницы, поэтому время получения
+    страницы не зависит от ее номера. Последнее поле keyset_ordering должно
+    быть уникальным, поля сортировки не должны содержать NULL.
+    """
+
+    cursor_query_param = CURSOR_QUERY_PARAM
+    keyset_ordering: tuple[str, ...] = ()
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.is_keyset = self.cursor_query_param in request.query_params
+        if not self.is_keyset:
+            return super().paginate_queryset(queryset, request, view)
+
+        self.request = request
+        page_size = self.get_page_size(request)
+        queryset = queryset.order_by(*self.keyset_ordering)
+        cursor = request.query_params[self.cursor_query_param]
+        if cursor:
+            queryset = queryset.filter(
+                self._get_keyset_filter(queryset, cursor)
+            )
+        page = list(queryset[: page_size + 1])
+        self.next_cursor = None
+        if len(page) > page_size:
+            page = page[:page_size]
+            self.next_cursor = self._encode_cursor(page[-1])
+        return page
+
+    def get_paginated_response(self, data):
+        if not self.is_keyset:
+            return super().get_paginated_response(data)
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def get_next_link(self):
+        if not self.is_keyset:
+            return super().get_next_link()
+        if self.next_cursor is None:
+            return None
+        return replace_query_param(
+            self.request.build_absolute_uri(),
+            self.cursor_query_param,
+            self.next_cursor,
+        )
+
+    def _get_ordering_fields(self):
+        """Метод получения пар (поле, по убыванию) для сортировки."""
+
+        return [
+            (field.lstrip("-"), field.startswith("-"))
+            for field in self.keyset_ordering
+        ]
+
+    @staticmethod
+    def _get_model_field(model, name: str):
+        if name == "pk":
+            return model._meta.pk
+        return model._meta.get_field(name)
+
+    def _encode_cursor(self, instance) -> str:
+        """Метод кодирования значений полей сортировки объекта в курсор."""
+
+        values = [
+            self._get_model_field(instance, field).value_to_string(instance)
+            for field, _ in self._get_ordering_fields()
+        ]
+        return urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+    def _decode_cursor(self, queryset, cursor: str) -> list:
+        """Метод декодирования курсора в значения полей сортировки."""
+
+        fields = self._get_ordering_fields()
+        try:
+            values = json.loads(urlsafe_b64decode(cursor.encode()))
+            if not isinstance(values, list) or len(values) != len(fields):
+                raise ValueError
+            return [
+                self._get_model_field(queryset.model, field).to_python(value)
+                for (field, _), value in zip(fields, values)
+            ]
+        except (BinasciiError, ValidationError, ValueError, TypeError):
+            raise NotFound(INVALID_CURSOR_MESSAGE)
+
+    def _get_keyset_filter(self, queryset, cursor: str) -> Q:
+        """
+        Метод построения условия выбора объектов после курсора.
+
+        Для сортировки (a, -b, c) условие имеет вид
+        a >= x AND (a > x OR (a = x AND b < y) OR (a = x AND b = y AND c > z)).
+        Первое слагаемое дублирует старшее поле, чтобы база данных начала
+        чтение индекса сразу с нужного места.
+        """
+
+        fields = self._get_ordering_fields()
+        values = self._decode_cursor(queryset, cursor)
+        conditions = []
+        for position, (field, descending) in enumerate(fields):
+            equal = dict(zip((name for name, _ in fields[:position]), values))
+            lookup = "lt" if descending else "gt"
+            conditions.append(
+                Q(**equal, **{f"{field}__{lookup}": values[position]})
+            )
+        first_field, first_descending = fields[0]
+        first_lookup = "lte" if first_descending else "gte"
+        return Q(**{f"{first_field}__{first_lookup}": values[0]}) & reduce(
+            or_, conditions
+        )
@@ -1,4 +1,5 @@
 PROFILES_PAGE_SIZE = 7
+PROFILES_COUNT_ESTIMATE_THRESHOLD = 10_000
 ALLOWED_TAGS_BY_FRONT = [
     "ol",
     "ul",
@@ -1,7 +1,11 @@
-from api.v1.general.paginations import BasePagination
+from api.v1.general.paginations import KeysetPagination
 
-from .constants import PROFILES_PAGE_SIZE
+from .constants import PROFILES_COUNT_ESTIMATE_THRESHOLD, PROFILES_PAGE_SIZE
 
 
-class ProfilesPagination(BasePagination):
+class ProfilesPagination(KeysetPagination):
     page_size = PROFILES_PAGE_SIZE
+    count_estimate_threshold = PROFILES_COUNT_ESTIMATE_THRESHOLD
+    # Первичный ключ профиля - идентификатор пользователя, поэтому порядок
+    # по нему совпадает с порядком регистрации и не требует соединения.
+    keyset_ordering = ("-pk",)
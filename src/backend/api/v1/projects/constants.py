@@ -1,5 +1,11 @@
 PROJECT_PREVIEW_MAIN_PAGE_SIZE = 6
 PROJECT_PAGE_SIZE = 7
+PROJECT_COUNT_ESTIMATE_THRESHOLD = 10_000
+
+# Данные профилей владельца и участников не сбрасывают версию проекта,
+# поэтому время жизни кэша ограничивает их устаревание.
+PROJECT_DETAIL_CACHE_KEY = "projects:detail:{host}:{project_id}:{version}"
+PROJECT_DETAIL_CACHE_TIMEOUT = 60 * 10
 
 PROJECT_PARTICIPATION_REQUEST_DESTROY_ONLY_FIELDS = (
     "user__id",
@@ -1,7 +1,6 @@
-from django.contrib.postgres.search import SearchQuery, SearchVector
+from django.contrib.postgres.search import SearchQuery
 from django.db.models import Q
 from django_filters.rest_framework import FilterSet, filters
-from langdetect import detect
 
 from apps.general.constants import LEVEL_CHOICES
 from apps.general.models import Profession, Skill
@@ -11,6 +10,7 @@ from apps.projects.constants import (
     RequestStatuses,
 )
 from apps.projects.models import Direction, ParticipationRequest, Project
+from apps.projects.search import get_query_search_config
 
 
 class ProjectFilter(FilterSet):
@@ -58,16 +58,8 @@ class ProjectFilter(FilterSet):
         )
 
     def filter_recruitment_status(self, queryset, name, value):
-        if value == 1:
-            return queryset.exclude(
-                Q(project_specialists__is_required=False)
-                | Q(project_specialists=None)
-            )
-        elif value == 0:
-            return queryset.filter(
-                ~Q(project_specialists__is_required=True)
-                | Q(project_specialists=None)
-            )
+        if value in (0, 1):
+            return queryset.filter(is_recruiting=bool(value))
         return queryset
 
     def get_project_role(self, queryset, name, value):
@@ -82,17 +74,10 @@ class ProjectFilter(FilterSet):
 
     def project_search(self, queryset, name, value):
         if len(value) >= 3:
-            search_language = detect(value)
-            if search_language == "ru":
-                search_query = SearchQuery(value, config="russian")
-                vector = SearchVector("name", "description", config="russian")
-            elif search_language == "en":
-                search_query = SearchQuery(value, config="english")
-                vector = SearchVector("name", "description", config="english")
-            else:
-                search_query = SearchQuery(value)
-                vector = SearchVector("name", "description")
-            return queryset.annotate(search=vector).filter(search=search_query)
+            search_query = SearchQuery(
+                value, config=get_query_search_config(value)
+            )
+            return queryset.filter(search_vector=search_query)
         return queryset
 
     def filter_is_favorite_project(self, queryset, name, value):
@@ -7,6 +7,7 @@ from django.db import transaction
 from rest_framework import serializers
 
 from apps.general.models import Skill
+from apps.projects.cache import bump_projects_cache_version
 from apps.projects.models import Project, ProjectSpecialist
 
 
@@ -16,10 +17,7 @@ class RecruitmentStatusMixin:
     def get_recruitment_status(self, obj) -> str:
         """Метод определения статуса набора в проект."""
 
-        if any(
-            profession.is_required
-            for profession in obj.project_specialists.all()
-        ):
+        if obj.is_recruiting:
             return "Набор открыт"
         return "Набор закрыт"
 
@@ -160,6 +158,13 @@ class ProjectOrDraftCreateUpdateMixin:
                 if skills_data:
                     project_specialist.skills.set(skills_data)
 
+            # bulk_create не отправляет сигналы, поэтому статус набора
+            # пересчитывается, а кэш сбрасывается явно
+            Project.objects.filter(
+                pk=project_instance.id
+            ).update_recruitment_status()
+            bump_projects_cache_version((project_instance.id,))
+
     def create(self, validated_data) -> Project:
         """Метод создания проекта или его черновика."""
 
@@ -1,11 +1,22 @@
-from api.v1.general.paginations import BasePagination
+from api.v1.general.paginations import BasePagination, KeysetPagination
 
-from .constants import PROJECT_PAGE_SIZE, PROJECT_PREVIEW_MAIN_PAGE_SIZE
+from .constants import (
+    PROJECT_COUNT_ESTIMATE_THRESHOLD,
+    PROJECT_PAGE_SIZE,
+    PROJECT_PREVIEW_MAIN_PAGE_SIZE,
+)
 
 
 class ProjectPreviewMainPagination(BasePagination):
     page_size = PROJECT_PREVIEW_MAIN_PAGE_SIZE
 
 
-class ProjectPagination(BasePagination):
+class ProjectPagination(KeysetPagination):
     page_size = PROJECT_PAGE_SIZE
+    count_estimate_threshold = PROJECT_COUNT_ESTIMATE_THRESHOLD
+    keyset_ordering = ("project_status", "-created", "-id")
+
+
+class ParticipationRequestPagination(KeysetPagination):
+    page_size = PROJECT_PAGE_SIZE
+    keyset_ordering = ("-created", "-id")
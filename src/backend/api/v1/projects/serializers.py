@@ -163,10 +163,13 @@ class ReadProjectSerializer(RecruitmentStatusMixin, BaseProjectSerializer):
         Метод возвращает True если user добавил проект в избранное.
         В противном случе возвращает False.
         Для неавторизованных пользователей всегда возвращает False.
+        Использует аннотацию is_favorite из queryset-а, если она есть.
         """
         request = self.context.get("request", None)
         if user := getattr(request, "user", None):
             if user.is_authenticated:
+                if hasattr(project, "is_favorite"):
+                    return project.is_favorite
                 return project.favorited_by.filter(id=user.id).exists()
         return False
 
@@ -184,15 +187,16 @@ class ReadProjectSerializer(RecruitmentStatusMixin, BaseProjectSerializer):
         }
 
     def get_unique_project_participants_skills(self, obj) -> list[Any]:
+        """
+        Метод возвращает уникальные навыки участников проекта.
+        Использует предзагруженных участников и их навыки, поэтому не делает
+        запросов на каждый проект страницы.
+        """
         all_skills = chain.from_iterable(
-            [
-                participant.skills.values_list("name", flat=True)
-                for participant in ProjectParticipant.objects.filter(
-                    project=obj
-                )
-            ]
+            participant.skills.all()
+            for participant in obj.project_participants.all()
         )
-        return list(set(all_skills))
+        return list(dict.fromkeys(skill.name for skill in all_skills))
 
     def to_representation(self, instance):
         rep = super().to_representation(instance)
@@ -1,6 +1,7 @@
 from django.contrib.auth.base_user import AbstractBaseUser
 from django.contrib.auth.models import AnonymousUser
-from django.db.models import Prefetch, Q, QuerySet
+from django.core.cache import cache
+from django.db.models import Exists, OuterRef, Prefetch, Q, QuerySet
 from django.db.models.manager import BaseManager
 from django.shortcuts import get_object_or_404
 from django_filters.rest_framework import DjangoFilterBackend
@@ -22,6 +23,7 @@ from rest_framework.viewsets import (
 
 from api.v1.projects.filters import MyRequestsFilter, ProjectFilter
 from api.v1.projects.paginations import (
+    ParticipationRequestPagination,
     ProjectPagination,
     ProjectPreviewMainPagination,
 )
@@ -49,6 +51,7 @@ from api.v1.projects.serializers import (
     WriteProjectSerializer,
     WriteProjectSpecialistSerializer,
 )
+from apps.projects.cache import get_project_cache_version
 from apps.projects.constants import RequestStatuses
 from apps.projects.models import (
     Direction,
@@ -59,7 +62,11 @@ from apps.projects.models import (
     ProjectSpecialist,
 )
 
-from .constants import PROJECT_PARTICIPATION_REQUEST_ONLY_FIELDS
+from .constants import (
+    PROJECT_DETAIL_CACHE_KEY,
+    PROJECT_DETAIL_CACHE_TIMEOUT,
+    PROJECT_PARTICIPATION_REQUEST_ONLY_FIELDS,
+)
 
 
 class DirectionViewSet(ReadOnlyModelViewSet):
@@ -77,10 +84,9 @@ class BaseProjectViewSet(ModelViewSet):
         Project.objects.all()
         .select_related(
             "creator",
-            "owner",
+            "owner__profile",
         )
-        .prefetch_related("favorited_by")
-        .order_by("project_status", "-created")
+        .order_by("project_status", "-created", "-id")
     )
 
     def get_queryset(self):
@@ -95,10 +101,34 @@ class BaseProjectViewSet(ModelViewSet):
                         "profession"
                     ).prefetch_related("skills"),
                 ),
+                Prefetch(
+                    "project_participants",
+                    queryset=ProjectParticipant.objects.select_related(
+                        "user__profile", "profession"
+                    ).prefetch_related("skills"),
+                ),
                 "directions",
             )
+            queryset = self._annotate_is_favorite(queryset, self.request.user)
         return self._get_queryset_with_params(queryset, user=self.request.user)
 
+    @staticmethod
+    def _annotate_is_favorite(queryset, user):
+        """
+        Метод аннотирования признака избранного проекта для авторизованного
+        пользователя одним подзапросом на всю страницу.
+        """
+
+        if not user.is_authenticated:
+            return queryset
+        return queryset.annotate(
+            is_favorite=Exists(
+                Project.favorited_by.through.objects.filter(
+                    project_id=OuterRef("pk"), user_id=user.pk
+                )
+            )
+        )
+
 
 class ProjectViewSet(BaseProjectViewSet):
     """Представление проектов."""
@@ -131,6 +161,45 @@ class ProjectViewSet(BaseProjectViewSet):
         queryset = self._get_queryset_with_params(queryset, self.request.user)
         return queryset
 
+    def retrieve(self, request, *args, **kwargs):
+        """
+        Метод получения проекта.
+
+        Общая для всех пользователей часть представления активного или
+        завершенного проекта кэшируется по версии проекта, а признак
+        избранного добавляется поверх нее для каждого пользователя.
+        """
+
+        project_id = kwargs[self.lookup_url_kwarg or self.lookup_field]
+        if request.query_params or not str(project_id).isdigit():
+            return super().retrieve(request, *args, **kwargs)
+
+        cache_key = PROJECT_DETAIL_CACHE_KEY.format(
+            host=request.get_host(),
+            project_id=project_id,
+            version=get_project_cache_version(project_id),
+        )
+        data = cache.get(cache_key)
+        if data is None:
+            instance = self.get_object()
+            data = self.get_serializer(instance).data
+            if instance.project_status != Project.DRAFT:
+                cache.set(
+                    cache_key,
+                    {**data, "is_favorite": False},
+                    PROJECT_DETAIL_CACHE_TIMEOUT,
+                )
+            return Response(data)
+
+        user = request.user
+        data["is_favorite"] = (
+            user.is_authenticated
+            and Project.favorited_by.through.objects.filter(
+                project_id=project_id, user_id=user.pk
+            ).exists()
+        )
+        return Response(data)
+
     def get_serializer_class(self):
         """Метод получения сериализатора для проектов."""
 
@@ -337,7 +406,7 @@ class ProjectParticipationRequestsViewSet(ModelViewSet):
     http_method_names = ("get", "post", "patch", "delete", "options")
     filter_backends = (DjangoFilterBackend,)
     filterset_class = MyRequestsFilter
-    pagination_class = ProjectPagination
+    pagination_class = ParticipationRequestPagination
 
     def get_queryset(self) -> QuerySet["ParticipationRequest"]:
         """Метод получения queryset-а для запросов на участие в проекте."""
@@ -0,0 +1,43 @@
+from uuid import uuid4
+
+from django.core.cache import cache
+from django.db import transaction
+
+from .constants import CACHE_VERSION_KEY, CACHE_VERSION_TIMEOUT
+
+
+def get_cache_version(name: str) -> str:
+    """
+    Функция получения текущей версии кэша по имени.
+
+    Версия хранится в самом кэше, поэтому ее проверка не обращается к базе
+    данных. Если версии нет, то создается новая.
+    """
+
+    return cache.get_or_set(
+        CACHE_VERSION_KEY.format(name),
+        uuid4().hex,
+        timeout=CACHE_VERSION_TIMEOUT,
+    )
+
+
+def _set_new_cache_versions(names) -> None:
+    cache.set_many(
+        {CACHE_VERSION_KEY.format(name): uuid4().hex for name in names},
+        timeout=CACHE_VERSION_TIMEOUT,
+    )
+
+
+def bump_cache_version(*names: str) -> None:
+    """
+    Функция смены версий кэша по именам.
+
+    Новая версия - случайная строка, а не счетчик, поэтому после вытеснения
+    ключа версии из кэша старые данные под совпавшей версией не вернутся.
+    Версия меняется сразу и еще раз после фиксации транзакции, чтобы не
+    оставить в кэше данные, прочитанные параллельным запросом до фиксации.
+    """
+
+    if names:
+        _set_new_cache_versions(names)
+        transaction.on_commit(lambda: _set_new_cache_versions(names))
@@ -81,3 +81,11 @@ MAX_SKILLS_MESSAGE = (
 MAX_LENGTH_URL = 256
 
 URL_TO_PROFILE = f"{getattr(settings, 'SERVER_NAME', 'localhost')}/profile"
+
+CACHE_VERSION_KEY = "version:{}"
+CACHE_VERSION_TIMEOUT = 60 * 60 * 24
+
+LANGUAGE_DETECTION_SEED = 0
+LANGUAGE_DETECTION_CACHE_SIZE = 1024
+CYRILLIC_LANGUAGE = "ru"
+LATIN_LANGUAGE = "en"
@@ -0,0 +1,79 @@
+import re
+from functools import lru_cache
+from typing import Optional
+
+from langdetect import DetectorFactory, detect
+from langdetect.detector_factory import init_factory
+from langdetect.lang_detect_exception import LangDetectException
+
+from .constants import (
+    CYRILLIC_LANGUAGE,
+    LANGUAGE_DETECTION_CACHE_SIZE,
+    LANGUAGE_DETECTION_SEED,
+    LATIN_LANGUAGE,
+)
+
+# Фиксированное зерно делает результат langdetect одинаковым для одного и
+# того же текста.
+DetectorFactory.seed = LANGUAGE_DETECTION_SEED
+
+RUSSIAN_LETTERS = re.compile(r"[а-яё]", re.IGNORECASE)
+LATIN_LETTERS = re.compile(r"[a-z]", re.IGNORECASE)
+WHITESPACES = re.compile(r"\s+")
+
+
+def load_language_profiles() -> None:
+    """
+    Функция загрузки языковых профилей langdetect.
+
+    Вызывается при старте воркера, чтобы профили не загружались во время
+    первого поискового запроса.
+    """
+
+    init_factory()
+
+
+def normalize_text(text: str) -> str:
+    """Функция нормализации текста перед определением языка."""
+
+    return WHITESPACES.sub(" ", text).strip().lower()
+
+
+def detect_language(text: str) -> Optional[str]:
+    """
+    Функция определения языка текста.
+
+    Текст из русских и латинских букв, в котором есть русские, считается
+    русским: конфигурация поиска russian обрабатывает латинские слова
+    английским стеммером. Текст только из латинских букв считается
+    английским. Статистическая модель langdetect используется лишь для
+    текста с другими буквами.
+    """
+
+    text = normalize_text(text)
+    letters = "".join(filter(str.isalpha, text))
+    if not letters:
+        return None
+    latin_letters = RUSSIAN_LETTERS.sub("", letters)
+    if not LATIN_LETTERS.sub("", latin_letters):
+        if len(latin_letters) < len(letters):
+            return CYRILLIC_LANGUAGE
+        return LATIN_LANGUAGE
+    try:
+        return detect(text)
+    except LangDetectException:
+        return None
+
+
+@lru_cache(maxsize=LANGUAGE_DETECTION_CACHE_SIZE)
+def _detect_normalized_query_language(query: str) -> Optional[str]:
+    return detect_language(query)
+
+
+def detect_query_language(query: str) -> Optional[str]:
+    """
+    Функция определения языка поискового запроса. Результаты кэшируются по
+    нормализованному запросу.
+    """
+
+    return _detect_normalized_query_language(normalize_text(query))
@@ -29,25 +29,20 @@ class ProjectAdmin(RecruitmentStatusMixin, admin.ModelAdmin):
     def get_queryset(self, request):
         """Метод получения queryset-а для проектов и черновиков."""
 
-        return (
-            Project.objects.select_related("creator", "owner")
-            .only(
-                "creator__email",
-                "owner__email",
-                "name",
-                "description",
-                "started",
-                "ended",
-                "busyness",
-                "phone_number",
-                "telegram_nick",
-                "email",
-                "link",
-                "project_status",
-            )
-            .prefetch_related(
-                "project_specialists",
-            )
+        return Project.objects.select_related("creator", "owner").only(
+            "creator__email",
+            "owner__email",
+            "name",
+            "description",
+            "started",
+            "ended",
+            "busyness",
+            "phone_number",
+            "telegram_nick",
+            "email",
+            "link",
+            "project_status",
+            "is_recruiting",
         )
 
     def recruitment_status(self, obj):
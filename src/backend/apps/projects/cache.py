@@ -0,0 +1,21 @@
+from typing import Iterable
+
+from apps.general.cache import bump_cache_version, get_cache_version
+from apps.projects.constants import PROJECT_CACHE_VERSION_NAME
+
+
+def get_project_cache_version(project_id) -> str:
+    """Функция получения версии кэша проекта."""
+
+    return get_cache_version(PROJECT_CACHE_VERSION_NAME.format(project_id))
+
+
+def bump_projects_cache_version(project_ids: Iterable) -> None:
+    """Функция сброса версий кэша проектов."""
+
+    bump_cache_version(
+        *{
+            PROJECT_CACHE_VERSION_NAME.format(project_id)
+            for project_id in project_ids
+        }
+    )
@@ -56,6 +56,12 @@ PROJECT_STATUS_CHOICES = (
 
 PROJECTS_PER_PAGE = 10
 
+PROJECT_CACHE_VERSION_NAME = "project:{}"
+
+PROJECT_SEARCH_FIELDS = frozenset(("name", "description"))
+SEARCH_CONFIGS = {"ru": "russian", "en": "english"}
+DEFAULT_SEARCH_CONFIG = "simple"
+
 
 class RequestStatuses(models.IntegerChoices):
     """Класс вариантов статуса запроса на участие."""
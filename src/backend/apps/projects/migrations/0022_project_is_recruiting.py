@@ -0,0 +1,43 @@
+# Generated by Django 5.0.1 on 2026-10-18 04:11
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Exists, OuterRef
+
+
+def fill_is_recruiting(apps, schema_editor):
+    Project = apps.get_model("projects", "Project")
+    ProjectSpecialist = apps.get_model("projects", "ProjectSpecialist")
+
+    Project.objects.update(
+        is_recruiting=Exists(
+            ProjectSpecialist.objects.filter(
+                project=OuterRef("pk"), is_required=True
+            )
+        )
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("projects", "0021_alter_invitationtoproject_answer_and_more"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="project",
+            name="is_recruiting",
+            field=models.BooleanField(
+                default=False, editable=False, verbose_name="Набор открыт"
+            ),
+        ),
+        migrations.RunPython(fill_is_recruiting, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="project",
+            index=models.Index(
+                fields=["is_recruiting", "project_status", "-created"],
+                name="project_recruiting_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.0.1 on 2026-10-18 04:14
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.db import migrations
+
+from apps.projects.search import update_projects_search_vector
+
+
+def fill_search_vector(apps, schema_editor):
+    Project = apps.get_model("projects", "Project")
+
+    update_projects_search_vector(
+        Project.objects,
+        Project.objects.only("name", "description").iterator(),
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("projects", "0022_project_is_recruiting"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="project",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True, verbose_name="Поисковый вектор"
+            ),
+        ),
+        migrations.RunPython(fill_search_vector, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="project",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="project_search_vector_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.0.1 on 2026-10-18 04:17
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("projects", "0023_project_search_vector"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="participationrequest",
+            index=models.Index(
+                fields=["user", "-created", "-id"],
+                name="request_user_keyset_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="project",
+            index=models.Index(
+                fields=["project_status", "-created", "-id"],
+                name="project_keyset_idx",
+            ),
+        ),
+    ]
@@ -2,8 +2,10 @@ import re
 
 from django.contrib.auth import get_user_model
 from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.core.validators import MinLengthValidator, RegexValidator
 from django.db import models
+from django.db.models import Exists, OuterRef
 
 from apps.general.constants import LEVEL_CHOICES
 from apps.general.fields import BaseTextField, CustomURLField
@@ -69,6 +71,24 @@ class Direction(models.Model):
         return self.name
 
 
+class ProjectQuerySet(models.QuerySet):
+    """QuerySet проектов."""
+
+    def update_recruitment_status(self) -> int:
+        """
+        Метод пересчета сохраненного статуса набора в проекты: набор открыт,
+        если проекту требуется хотя бы один специалист.
+        """
+
+        return self.update(
+            is_recruiting=Exists(
+                ProjectSpecialist.objects.filter(
+                    project=OuterRef("pk"), is_required=True
+                )
+            )
+        )
+
+
 class Project(CreatedModifiedFields, ContactsFields):
     """Модель проекта."""
 
@@ -165,6 +185,18 @@ class Project(CreatedModifiedFields, ContactsFields):
         related_name="favorite_projects",
         blank=True,
     )
+    is_recruiting = models.BooleanField(
+        verbose_name="Набор открыт",
+        default=False,
+        editable=False,
+    )
+    search_vector = SearchVectorField(
+        verbose_name="Поисковый вектор",
+        null=True,
+        editable=False,
+    )
+
+    objects = ProjectQuerySet.as_manager()
 
     class Meta:
         verbose_name = "Проект"
@@ -182,6 +214,18 @@ class Project(CreatedModifiedFields, ContactsFields):
                 name="project_search_idx",
                 opclasses=["gin_trgm_ops", "gin_trgm_ops"],
             ),
+            models.Index(
+                fields=["is_recruiting", "project_status", "-created"],
+                name="project_recruiting_idx",
+            ),
+            models.Index(
+                fields=["project_status", "-created", "-id"],
+                name="project_keyset_idx",
+            ),
+            GinIndex(
+                fields=["search_vector"],
+                name="project_search_vector_idx",
+            ),
         ]
 
     def __str__(self) -> str:
@@ -278,6 +322,12 @@ class ParticipationRequest(ParticipationRequestAndInvitationBasemodel):
         verbose_name = "Запрос на участие"
         verbose_name_plural = "Запросы на участие"
         default_related_name = "participation_requests"
+        indexes = [
+            models.Index(
+                fields=["user", "-created", "-id"],
+                name="request_user_keyset_idx",
+            ),
+        ]
         constraints = (
             models.UniqueConstraint(
                 fields=("project", "user", "position"),
@@ -0,0 +1,54 @@
+from collections import defaultdict
+from typing import Iterable
+
+from django.contrib.postgres.search import SearchVector
+from django.db import connection
+
+from apps.general.language import detect_language, detect_query_language
+from apps.projects.constants import DEFAULT_SEARCH_CONFIG, SEARCH_CONFIGS
+
+
+def get_search_config(text: str) -> str:
+    """Функция выбора конфигурации полнотекстового поиска по языку текста."""
+
+    return SEARCH_CONFIGS.get(detect_language(text), DEFAULT_SEARCH_CONFIG)
+
+
+def get_query_search_config(query: str) -> str:
+    """
+    Функция выбора конфигурации полнотекстового поиска по языку поискового
+    запроса.
+    """
+
+    return SEARCH_CONFIGS.get(
+        detect_query_language(query), DEFAULT_SEARCH_CONFIG
+    )
+
+
+def get_project_search_vector(config: str) -> SearchVector:
+    """Функция построения поискового вектора проекта."""
+
+    return SearchVector("name", weight="A", config=config) + SearchVector(
+        "description", weight="B", config=config
+    )
+
+
+def update_projects_search_vector(queryset, projects: Iterable) -> None:
+    """
+    Функция обновления сохраненного поискового вектора проектов. Проекты
+    группируются по языку содержимого, чтобы обновить каждую группу одним
+    запросом. Вне PostgreSQL (локальная SQLite) вектор не заполняется.
+    """
+
+    if connection.vendor != "postgresql":
+        return
+    project_ids_by_config = defaultdict(list)
+    for project in projects:
+        config = get_search_config(
+            f"{project.name} {project.description or ''}"
+        )
+        project_ids_by_config[config].append(project.pk)
+    for config, project_ids in project_ids_by_config.items():
+        queryset.filter(pk__in=project_ids).update(
+            search_vector=get_project_search_vector(config)
+        )
@@ -1,7 +1,21 @@
-from django.db.models.signals import post_save
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+)
 from django.dispatch import receiver
 
-from apps.projects.models import InvitationToProject, Project
+from apps.projects.cache import bump_projects_cache_version
+from apps.projects.constants import PROJECT_SEARCH_FIELDS
+from apps.projects.models import (
+    Direction,
+    InvitationToProject,
+    Project,
+    ProjectParticipant,
+    ProjectSpecialist,
+)
+from apps.projects.search import update_projects_search_vector
 
 from .tasks import send_invitation_email
 
@@ -15,9 +29,104 @@ def create_user_profile(sender, instance, created, **kwargs):
         instance.creator.save()
 
 
+@receiver(post_save, sender=Project)
+def update_project_search_vector(sender, instance, update_fields, **kwargs):
+    """Метод обновления поискового вектора при изменении текста проекта."""
+
+    if update_fields is not None and not PROJECT_SEARCH_FIELDS.intersection(
+        update_fields
+    ):
+        return
+    update_projects_search_vector(Project.objects, (instance,))
+
+
 @receiver(post_save, sender=InvitationToProject)
 def send_invite_to_user(sender, instance, created, **kwargs):
     """Метод отправки письма пользователю, когда его приглашают в проект"""
     email = instance.user.email
     if created:
         send_invitation_email.delay(email)
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_delete, sender=Project)
+def reset_project_cache(sender, instance, **kwargs):
+    """Метод сброса кэша проекта при его изменении или удалении."""
+
+    bump_projects_cache_version((instance.pk,))
+
+
+@receiver(post_save, sender=ProjectSpecialist)
+@receiver(post_delete, sender=ProjectSpecialist)
+@receiver(post_save, sender=ProjectParticipant)
+@receiver(post_delete, sender=ProjectParticipant)
+def reset_project_cache_on_related_change(sender, instance, **kwargs):
+    """
+    Метод сброса кэша проекта при изменении его специалистов или
+    участников.
+    """
+
+    bump_projects_cache_version((instance.project_id,))
+
+
+@receiver(post_save, sender=ProjectSpecialist)
+@receiver(post_delete, sender=ProjectSpecialist)
+def update_project_recruitment_status(sender, instance, **kwargs):
+    """Метод пересчета статуса набора при изменении специалистов проекта."""
+
+    Project.objects.filter(pk=instance.project_id).update_recruitment_status()
+
+
+@receiver(post_save, sender=Direction)
+@receiver(pre_delete, sender=Direction)
+def reset_project_cache_on_direction_change(sender, instance, **kwargs):
+    """
+    Метод сброса кэша проектов при изменении или удалении направления
+    разработки.
+    """
+
+    bump_projects_cache_version(
+        instance.projects_direction.values_list("pk", flat=True)
+    )
+
+
+@receiver(m2m_changed, sender=Project.directions.through)
+def reset_project_cache_on_directions_change(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    """Метод сброса кэша проектов при изменении их направлений."""
+
+    if reverse and action in ("post_add", "post_remove"):
+        bump_projects_cache_version(pk_set)
+    elif reverse and action == "pre_clear":
+        bump_projects_cache_version(
+            instance.projects_direction.values_list("pk", flat=True)
+        )
+    elif action in ("post_add", "post_remove", "post_clear"):
+        bump_projects_cache_version((instance.pk,))
+
+
+@receiver(m2m_changed, sender=ProjectSpecialist.skills.through)
+@receiver(m2m_changed, sender=ProjectParticipant.skills.through)
+def reset_project_cache_on_skills_change(
+    sender, instance, action, reverse, model, pk_set, **kwargs
+):
+    """
+    Метод сброса кэша проектов при изменении навыков их специалистов или
+    участников.
+    """
+
+    if reverse and action in ("post_add", "post_remove"):
+        bump_projects_cache_version(
+            model.objects.filter(pk__in=pk_set).values_list(
+                "project_id", flat=True
+            )
+        )
+    elif reverse and action == "pre_clear":
+        bump_projects_cache_version(
+            model.objects.filter(skills=instance).values_list(
+                "project_id", flat=True
+            )
+        )
+    elif action in ("post_add", "post_remove", "post_clear"):
+        bump_projects_cache_version((instance.project_id,))
@@ -2,16 +2,20 @@ from django.utils import timezone
 from templated_mail.mail import BaseEmailMessage
 
 from apps.general.constants import URL_TO_PROFILE
+from apps.projects.cache import bump_projects_cache_version
 from apps.projects.models import Project
 from config.celery import app
 
 
 @app.task
 def auto_completion_projects_task():
-    Project.objects.filter(
+    projects = Project.objects.filter(
         ended__lt=timezone.localdate(),
         project_status=Project.ACTIVE,
-    ).update(project_status=Project.ENDED)
+    )
+    project_ids = list(projects.values_list("pk", flat=True))
+    projects.filter(pk__in=project_ids).update(project_status=Project.ENDED)
+    bump_projects_cache_version(project_ids)
 
 
 @app.task
@@ -5,3 +5,7 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.prod")
 
 application = get_asgi_application()
+
+from apps.general.language import load_language_profiles  # noqa: E402
+
+load_language_profiles()
@@ -1,4 +1,13 @@
 import pytest
+from django.core.cache import cache
+from rest_framework.test import APIClient
+
+QUERY_BUDGET_REPORT = pytest.StashKey[list]()
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
 
 
 @pytest.fixture
@@ -22,3 +31,38 @@ def profile(user):
     profile.name = "profile_name"
     profile.save()
     return profile
+
+
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+
+@pytest.fixture
+def user_api_client(user, api_client):
+    api_client.force_authenticate(user)
+    return api_client
+
+
+@pytest.fixture
+def query_budget_report(request):
+    """Фикстура строк отчета о запросах к базе данных по эндпоинтам."""
+
+    return request.config.stash.setdefault(QUERY_BUDGET_REPORT, [])
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """Вывод отчета о запросах к базе данных по эндпоинтам."""
+
+    report = config.stash.get(QUERY_BUDGET_REPORT, [])
+    if not report:
+        return
+    terminalreporter.section("query budget")
+    terminalreporter.write_line(
+        f"{'endpoint':<20}{'queries':>12}{'time, ms':>20}"
+    )
+    for name, small, large, small_time, large_time in report:
+        terminalreporter.write_line(
+            f"{name:<20}{f'{small} / {large}':>12}"
+            f"{f'{small_time * 1000:.1f} / {large_time * 1000:.1f}':>20}"
+        )
@@ -0,0 +1,54 @@
+import pytest
+
+from apps.general import language
+
+
+@pytest.fixture
+def model_calls(monkeypatch):
+    """Фикстура, подсчитывающая обращения к статистической модели."""
+
+    calls = []
+    detect = language.detect
+
+    def counting_detect(text):
+        calls.append(text)
+        return detect(text)
+
+    monkeypatch.setattr(language, "detect", counting_detect)
+    language._detect_normalized_query_language.cache_clear()
+    yield calls
+    language._detect_normalized_query_language.cache_clear()
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    (
+        ("Мобильные игры", "ru"),
+        ("weather forecast", "en"),
+        ("Поиск django", "ru"),
+        ("  123 - 456 ", None),
+    ),
+)
+def test_detect_language_by_script(model_calls, text, expected):
+    """Тест определения языка по алфавиту без статистической модели."""
+    assert language.detect_language(text) == expected
+    assert model_calls == []
+
+
+def test_detect_language_by_model_is_deterministic(model_calls):
+    """Тест повторяемости результата статистической модели."""
+    text = "Entwicklung einer Lernplattform für Schüler"
+    results = {language.detect_language(text) for _ in range(5)}
+    assert results == {"de"}
+    assert len(model_calls) == 5
+
+
+def test_detect_query_language_is_cached(model_calls):
+    """Тест кэширования языка запроса по нормализованному тексту."""
+    assert language.detect_query_language("Lernplattform  für Schüler") == (
+        "de"
+    )
+    assert language.detect_query_language(" lernplattform für schüler ") == (
+        "de"
+    )
+    assert len(model_calls) == 1
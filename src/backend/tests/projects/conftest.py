@@ -2,13 +2,14 @@ import datetime
 
 import pytest
 
+from apps.general.models import Profession, Skill
 from apps.projects.constants import (
     BUSYNESS_CHOICES,
     MAX_LENGTH_DESCRIPTION,
     MAX_LENGTH_PROJECT_NAME,
     PROJECT_STATUS_CHOICES,
 )
-from apps.projects.models import Project
+from apps.projects.models import Project, ProjectParticipant
 
 
 @pytest.fixture
@@ -28,3 +29,48 @@ def valid_data_project(user):
 @pytest.fixture
 def project(valid_data_project):
     return Project.objects.create(**valid_data_project)
+
+
+@pytest.fixture
+def profession():
+    return Profession.objects.create(
+        speciality="Developer", specialization="Backend"
+    )
+
+
+@pytest.fixture
+def skills():
+    return Skill.objects.bulk_create(
+        Skill(name=name) for name in ("Python", "Django", "PostgreSQL")
+    )
+
+
+@pytest.fixture
+def create_projects(django_user_model, valid_data_project, profession, skills):
+    """Фабрика проектов с участниками, у каждого из которых есть навыки."""
+
+    def factory(projects_count, participants_count):
+        projects = []
+        for project_number in range(projects_count):
+            project = Project.objects.create(
+                **{
+                    **valid_data_project,
+                    "name": f"project {project_number}",
+                    "project_status": Project.ACTIVE,
+                }
+            )
+            for participant_number in range(participants_count):
+                participant_user = django_user_model.objects.create(
+                    email=f"p{project.pk}_{participant_number}@test.com",
+                    username=f"p{project.pk}_{participant_number}",
+                )
+                participant = ProjectParticipant.objects.create(
+                    project=project,
+                    user=participant_user,
+                    profession=profession,
+                )
+                participant.skills.set(skills)
+            projects.append(project)
+        return projects
+
+    return factory
@@ -0,0 +1,221 @@
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from api.v1.projects.paginations import ProjectPagination
+from apps.projects.models import Project, ProjectSpecialist
+
+PROJECTS_URL = "/api/v1/projects/"
+
+
+@pytest.mark.django_db
+def test_project_list_is_favorite(user, user_api_client, project):
+    project.favorited_by.add(user)
+    response = user_api_client.get(PROJECTS_URL)
+    assert response.data["results"][0]["is_favorite"] is True
+
+
+@pytest.mark.django_db
+def test_project_list_is_not_favorite(user_api_client, project):
+    response = user_api_client.get(PROJECTS_URL)
+    assert response.data["results"][0]["is_favorite"] is False
+
+
+def get_participants_queries_count(client, projects_count):
+    with CaptureQueriesContext(connection) as context:
+        response = client.get(PROJECTS_URL, {"page_size": projects_count})
+    assert len(response.data["results"]) == projects_count
+    return sum(
+        "projects_projectparticipant" in query["sql"]
+        for query in context.captured_queries
+    )
+
+
+@pytest.mark.django_db
+def test_participants_skills_queries_do_not_depend_on_page_size(
+    api_client, create_projects
+):
+    create_projects(projects_count=5, participants_count=3)
+    small_page_count = get_participants_queries_count(api_client, 1)
+    large_page_count = get_participants_queries_count(api_client, 5)
+    assert small_page_count == large_page_count
+
+
+@pytest.mark.django_db
+def test_unique_participants_skills(api_client, create_projects, skills):
+    create_projects(projects_count=1, participants_count=2)
+    response = api_client.get(PROJECTS_URL)
+    assert sorted(
+        response.data["results"][0]["unique_project_participants_skills"]
+    ) == sorted(skill.name for skill in skills)
+
+
+def get_queries_count(client, projects_count):
+    # Количество проектов кэшируется, сравниваются запросы без кэша.
+    cache.clear()
+    with CaptureQueriesContext(connection) as context:
+        response = client.get(PROJECTS_URL, {"page_size": projects_count})
+    assert len(response.data["results"]) == projects_count
+    return len(context.captured_queries)
+
+
+@pytest.mark.django_db
+def test_project_list_queries_do_not_depend_on_page_size(
+    api_client, create_projects
+):
+    create_projects(projects_count=5, participants_count=2)
+    assert get_queries_count(api_client, 1) == get_queries_count(api_client, 5)
+
+
+@pytest.mark.django_db
+def test_project_list_queries_do_not_depend_on_team_size(
+    api_client, create_projects
+):
+    create_projects(projects_count=1, participants_count=1)
+    small_team_count = get_queries_count(api_client, 1)
+    Project.objects.all().delete()
+    create_projects(projects_count=1, participants_count=4)
+    assert small_team_count == get_queries_count(api_client, 1)
+
+
+@pytest.mark.django_db
+def test_project_detail_cache_hit_does_not_touch_database(
+    api_client, create_projects, django_assert_num_queries
+):
+    (project,) = create_projects(projects_count=1, participants_count=2)
+    url = f"{PROJECTS_URL}{project.pk}/"
+    expected_data = api_client.get(url).data
+    with django_assert_num_queries(0):
+        assert api_client.get(url).data == expected_data
+
+
+@pytest.mark.django_db
+def test_project_detail_cache_is_reset_on_change(api_client, create_projects):
+    (project,) = create_projects(projects_count=1, participants_count=1)
+    url = f"{PROJECTS_URL}{project.pk}/"
+    api_client.get(url)
+    project.name = "new project name"
+    project.save()
+    project.project_participants.all().delete()
+    data = api_client.get(url).data
+    assert data["name"] == "new project name"
+    assert data["project_participants"] == []
+
+
+@pytest.mark.django_db
+def test_project_detail_cache_is_favorite_per_user(
+    user, user_api_client, create_projects
+):
+    (project,) = create_projects(projects_count=1, participants_count=0)
+    project.favorited_by.add(user)
+    url = f"{PROJECTS_URL}{project.pk}/"
+    assert APIClient().get(url).data["is_favorite"] is False
+    assert user_api_client.get(url).data["is_favorite"] is True
+
+
+@pytest.mark.django_db
+def test_project_recruitment_status_follows_specialists(
+    api_client, create_projects, profession
+):
+    opened, closed = create_projects(projects_count=2, participants_count=0)
+    specialist = ProjectSpecialist.objects.create(
+        project=opened,
+        profession=profession,
+        count=1,
+        level=1,
+        is_required=True,
+    )
+    ProjectSpecialist.objects.create(
+        project=closed,
+        profession=profession,
+        count=1,
+        level=1,
+        is_required=False,
+    )
+
+    response = api_client.get(PROJECTS_URL, {"recruitment_status": 1})
+    assert [item["id"] for item in response.data["results"]] == [opened.pk]
+    assert response.data["results"][0]["recruitment_status"] == (
+        "Набор открыт"
+    )
+    response = api_client.get(PROJECTS_URL, {"recruitment_status": 0})
+    assert [item["id"] for item in response.data["results"]] == [closed.pk]
+
+    specialist.delete()
+    opened.refresh_from_db()
+    assert opened.is_recruiting is False
+
+
+@pytest.mark.skipif(
+    connection.vendor != "postgresql",
+    reason="Полнотекстовый поиск работает только в PostgreSQL.",
+)
+@pytest.mark.django_db
+def test_project_search_uses_stored_vector(api_client, create_projects):
+    russian, english = create_projects(projects_count=2, participants_count=0)
+    russian.name = "Разработка игр"
+    russian.description = "Мы разрабатываем мобильные игры для детей"
+    russian.save()
+    english.name = "Weather service"
+    english.description = "Collecting forecasts from public weather stations"
+    english.save()
+
+    response = api_client.get(PROJECTS_URL, {"search": "мобильная игра"})
+    assert [item["id"] for item in response.data["results"]] == [russian.pk]
+    response = api_client.get(PROJECTS_URL, {"search": "forecast"})
+    assert [item["id"] for item in response.data["results"]] == [english.pk]
+
+
+@pytest.mark.django_db
+def test_project_list_keyset_pagination(api_client, create_projects):
+    projects = create_projects(projects_count=5, participants_count=0)
+    Project.objects.filter(pk=projects[0].pk).update(
+        project_status=Project.ENDED
+    )
+    expected = [
+        item["id"] for item in api_client.get(PROJECTS_URL).data["results"]
+    ]
+
+    received = []
+    url = f"{PROJECTS_URL}?cursor=&page_size=2"
+    while url:
+        response = api_client.get(url)
+        assert "count" not in response.data
+        received += [item["id"] for item in response.data["results"]]
+        url = response.data["next"]
+    assert received == expected
+    assert len(received) == 5
+
+
+@pytest.mark.django_db
+def test_project_list_invalid_cursor(api_client):
+    response = api_client.get(PROJECTS_URL, {"cursor": "invalid"})
+    assert response.status_code == 404
+
+
+@pytest.mark.django_db
+def test_project_list_count_is_cached(api_client, create_projects):
+    project, _ = create_projects(projects_count=2, participants_count=0)
+    assert api_client.get(PROJECTS_URL).data["count"] == 2
+    project.delete()
+    with CaptureQueriesContext(connection) as context:
+        response = api_client.get(PROJECTS_URL)
+    assert response.data["count"] == 2
+    assert response.data["count_is_approximate"] is False
+    assert not any(
+        "COUNT(" in query["sql"] for query in context.captured_queries
+    )
+
+
+@pytest.mark.django_db
+def test_project_list_count_estimate(api_client, create_projects, monkeypatch):
+    create_projects(projects_count=2, participants_count=0)
+    monkeypatch.setattr(ProjectPagination, "count_estimate_threshold", 0)
+    response = api_client.get(PROJECTS_URL)
+    if connection.vendor == "postgresql":
+        assert response.data["count_is_approximate"] is True
+    else:
+        assert response.data["count_is_approximate"] is False
+        assert response.data["count"] == 2
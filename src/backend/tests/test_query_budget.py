@@ -0,0 +1,155 @@
+from time import perf_counter
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from apps.general.models import Profession, Skill
+from apps.profile.models import Profile, Specialist
+from apps.projects.models import (
+    Direction,
+    InvitationToProject,
+    ParticipationRequest,
+    Project,
+    ProjectParticipant,
+    ProjectSpecialist,
+)
+
+ROWS_COUNT = 4
+SMALL_PAGE_SIZE = 1
+LARGE_PAGE_SIZE = ROWS_COUNT
+
+ENDPOINTS = (
+    ("projects", "/api/v1/projects/", {}),
+    ("drafts", "/api/v1/projects/drafts/", {}),
+    ("preview_main", "/api/v1/projects/preview_main/", {}),
+    ("directions", "/api/v1/projects/directions/", {}),
+    ("my requests", "/api/v1/projects/requests/", {}),
+    ("owner requests", "/api/v1/projects/requests/", {"role": "owner"}),
+    ("invitations", "/api/v1/projects/invitations/", {}),
+    pytest.param(
+        "profiles",
+        "/api/v1/profiles/",
+        {},
+        marks=pytest.mark.xfail(
+            strict=True,
+            reason="is_favorite профиля запрашивается для каждой строки.",
+        ),
+    ),
+    ("professions", "/api/v1/professions/", {}),
+    ("skills", "/api/v1/skills/", {}),
+    ("counter", "/api/v1/counter/", {}),
+)
+
+
+@pytest.fixture
+def dataset(user, django_user_model):
+    """
+    Фикстура набора данных, в котором каждого вида объектов, видимых
+    пользователю user, больше, чем помещается на маленькой странице.
+    """
+
+    skills = Skill.objects.bulk_create(
+        Skill(name=f"skill {number}") for number in range(3)
+    )
+    professions = Profession.objects.bulk_create(
+        Profession(speciality=f"speciality {number}", specialization="dev")
+        for number in range(ROWS_COUNT)
+    )
+    directions = Direction.objects.bulk_create(
+        Direction(name=f"direction{chr(ord('a') + number)}")
+        for number in range(ROWS_COUNT)
+    )
+    user.profile.visible_status = Profile.VisibilitySettings.ALL
+    user.profile.save()
+
+    for number in range(ROWS_COUNT):
+        other_user = django_user_model.objects.create(
+            email=f"member{number}@test.com", username=f"member{number}"
+        )
+        profile = other_user.profile
+        profile.visible_status = Profile.VisibilitySettings.ALL
+        profile.save()
+        profile.favorited_by.add(user)
+        Specialist.objects.create(
+            profile=profile, profession=professions[number], level=1
+        ).skills.set(skills)
+
+        for owner, status in (
+            (other_user, Project.ACTIVE),
+            (user, Project.ACTIVE),
+            (user, Project.DRAFT),
+        ):
+            project = Project.objects.create(
+                name=f"project {number} {owner.pk} {status}",
+                description="d" * 20,
+                creator=owner,
+                owner=owner,
+                project_status=status,
+            )
+            project.directions.set(directions)
+            project.favorited_by.add(user)
+            specialist = ProjectSpecialist.objects.create(
+                project=project,
+                profession=professions[number],
+                count=1,
+                level=1,
+                is_required=True,
+            )
+            specialist.skills.set(skills)
+            ProjectParticipant.objects.create(
+                project=project, user=other_user, profession=professions[0]
+            ).skills.set(skills)
+            if status == Project.DRAFT:
+                continue
+            applicant = user if owner == other_user else other_user
+            ParticipationRequest.objects.create(
+                project=project,
+                user=applicant,
+                position=specialist,
+                cover_letter="cover letter",
+            )
+            InvitationToProject.objects.create(
+                project=project,
+                user=applicant,
+                author=owner,
+                position=specialist,
+                cover_letter="cover letter",
+            )
+
+
+def measure(client, url, params, page_size):
+    """Функция подсчета запросов и времени ответа эндпоинта."""
+
+    cache.clear()
+    with CaptureQueriesContext(connection) as context:
+        started = perf_counter()
+        response = client.get(url, {**params, "page_size": page_size})
+        duration = perf_counter() - started
+    assert response.status_code == 200, response.data
+    return len(context.captured_queries), duration
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("name, url, params", ENDPOINTS)
+def test_endpoint_queries_do_not_depend_on_page_size(
+    user, dataset, query_budget_report, name, url, params
+):
+    """
+    Тест бюджета запросов: количество запросов к базе данных не растет
+    с увеличением количества объектов на странице.
+    """
+    client = APIClient()
+    client.force_authenticate(user)
+    small_queries, small_duration = measure(
+        client, url, params, SMALL_PAGE_SIZE
+    )
+    large_queries, large_duration = measure(
+        client, url, params, LARGE_PAGE_SIZE
+    )
+    query_budget_report.append(
+        (name, small_queries, large_queries, small_duration, large_duration)
+    )
+    assert small_queries == large_queries